@@ -1,10 +1,63 @@
+import asyncio
+import base64
+import functools
 import os
+import time
+from collections import OrderedDict
+from collections.abc import AsyncGenerator, AsyncIterator, Sequence
 from typing import Any, Optional
 from urllib.parse import urljoin
 
 import httpx
+import orjson
+
+from my_personal_assistant_shared.types.jira import JiraIssueStatus
 
 JIRA_API_VERSION = "rest/api/2"
+SEARCH_PATH = "search"
+ENHANCED_SEARCH_PATH = "search/jql"
+
+# Fields requested by search_issues when the caller does not pass any.
+_DEFAULT_SEARCH_FIELDS = (
+    "summary,status,assignee,labels,issuetype,priority,"
+    "reporter,created,updated,duedate,parent"
+)
+
+# Jira caps maxResults for /search at 100, so pages larger than this are wasted.
+SEARCH_PAGE_SIZE = 100
+# Number of search pages fetched concurrently once the result total is known.
+PAGE_FETCH_CONCURRENCY = 4
+
+# Jira issue types fetched for each logical issue kind in get_issues_batch.
+ISSUE_KIND_TYPES: dict[str, tuple[str, ...]] = {
+    "epic": ("Epic",),
+    "story": ("Story",),
+    "task": ("Task", "Sub-task"),
+}
+
+# Retry policy for transient failures (transport errors and 5xx responses) on
+# idempotent requests. Client errors such as 401/404 are never retried.
+MAX_REQUEST_ATTEMPTS = 3
+RETRY_BASE_DELAY = 4.0
+RETRY_MAX_DELAY = 10.0
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+# Connection pool limits for the Jira HTTP client. Keep-alive connections are
+# reused across requests so warm calls skip the TCP + TLS handshake.
+JIRA_HTTP_LIMITS = httpx.Limits(
+    max_connections=20, max_keepalive_connections=20, keepalive_expiry=30.0
+)
+# Fail fast on unreachable hosts while allowing slow JQL searches to finish.
+JIRA_HTTP_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+
+
+# Statuses accepted by the status filter, checked on every JQL build.
+_ALLOWED_STATUSES: frozenset[str] = frozenset(s.value for s in JiraIssueStatus)
+_ALLOWED_STATUSES_STR = ", ".join(sorted(_ALLOWED_STATUSES))
+
+
+# Identity of a GET for caching and in-flight sharing: (endpoint, sorted params).
+_RequestKey = tuple[str, tuple[tuple[str, Any], ...]]
 
 
 class FilterValidationError(ValueError):
@@ -13,12 +66,85 @@ class FilterValidationError(ValueError):
     pass
 
 
+def _decode(content: bytes) -> dict[str, Any]:
+    """Decodes a Jira JSON response body with orjson."""
+    data: dict[str, Any] = orjson.loads(content)
+    return data
+
+
+def _request_key(endpoint: str, params: Optional[dict[str, Any]]) -> _RequestKey:
+    """Builds the hashable identity of a GET.
+
+    List values, which httpx sends as repeated params, become tuples.
+    """
+    items = (
+        (name, tuple(value) if isinstance(value, list) else value)
+        for name, value in (params or {}).items()
+    )
+    return endpoint, tuple(sorted(items))
+
+
+@functools.lru_cache(maxsize=1024)
+def _build_jql_query(
+    project_key: Optional[str],
+    issue_types: Optional[tuple[str, ...]],
+    labels: Optional[tuple[str, ...]],
+    assignee: Optional[str],
+    status: Optional[str],
+) -> str:
+    """Builds a JQL query string from hashable filter parameters.
+
+    Memoized because the same filter combinations are requested repeatedly.
+    Invalid filters raise and are therefore never cached.
+    """
+    jql_parts = []
+    if project_key:
+        jql_parts.append(f"project = {project_key}")
+
+    if issue_types:
+        types_str = '", "'.join(issue_types)  # Enclose in quotes for JQL
+        jql_parts.append(f'issueType in ("{types_str}")')
+
+    if labels:
+        # Assuming labels are single words without spaces, or handled by Jira's JQL parsing
+        labels_str = '", "'.join(labels)
+        jql_parts.append(f'labels in ("{labels_str}")')
+
+    if assignee:
+        # Assignee can be username or display name, Jira handles this.
+        # For unassigned, use assignee is EMPTY or assignee is NULL
+        jql_parts.append(f'assignee = "{assignee}"')  # Enclose in quotes
+
+    if status:
+        if status not in _ALLOWED_STATUSES:
+            raise FilterValidationError(
+                f"Invalid status: '{status}'. "
+                f"Allowed statuses are: {_ALLOWED_STATUSES_STR}"
+            )
+        # Status names can have spaces, so enclose in quotes
+        jql_parts.append(f'status = "{status}"')
+
+    return " AND ".join(jql_parts)
+
+
 class JiraClient:
+    """Async client for the Jira REST API.
+
+    A caller may supply its own `client`, e.g. one shared for the app's
+    lifetime; it is not closed by this instance. It must use `api_base_url`
+    as its `base_url` and carry its own auth, as `username` and `api_token`
+    only configure the client built by default.
+    """
+
     def __init__(
         self,
         base_url: Optional[str] = None,
         username: Optional[str] = None,
         api_token: Optional[str] = None,
+        client: Optional[httpx.AsyncClient] = None,
+        cache_ttl: float = 0.0,
+        cache_max_size: int = 256,
+        use_enhanced_search: Optional[bool] = None,
     ):
         self.base_url = base_url or os.getenv("JIRA_BASE_URL")
         self.username = username or os.getenv("JIRA_USERNAME")
@@ -41,27 +167,160 @@ class JiraClient:
             )
 
         self.api_base_url = urljoin(self.base_url, f"{JIRA_API_VERSION}/")
-        self._client = httpx.AsyncClient(
-            auth=(self.username, self.api_token), timeout=30.0
+        # Jira Cloud's token-paginated search/jql skips the costly total count.
+        # Jira Server/Data Center only offer the classic startAt-based search,
+        # so deployments against them set JIRA_ENHANCED_SEARCH=false.
+        if use_enhanced_search is None:
+            setting = os.getenv("JIRA_ENHANCED_SEARCH", "true").lower()
+            use_enhanced_search = setting not in ("0", "false", "no", "off")
+        self.use_enhanced_search = use_enhanced_search
+        if client is not None and client.base_url != httpx.URL(self.api_base_url):
+            raise ValueError(
+                f"Jira HTTP client must use {self.api_base_url} as its base_url, "
+                f"not '{client.base_url}'."
+            )
+        self._owns_client = client is None
+        if client is None:
+            # Basic credentials are encoded once and sent as a default header,
+            # skipping httpx's per-request auth flow.
+            credentials = f"{self.username}:{self.api_token}".encode()
+            token = base64.b64encode(credentials).decode()
+            client = httpx.AsyncClient(
+                base_url=self.api_base_url,
+                headers={
+                    "Authorization": f"Basic {token}",
+                    "Accept": "application/json",
+                    # Search results are verbose JSON; httpx decompresses them.
+                    "Accept-Encoding": "gzip, br",
+                },
+                timeout=JIRA_HTTP_TIMEOUT,
+                limits=JIRA_HTTP_LIMITS,
+                http2=True,  # Multiplex concurrent searches over one connection
+            )
+        self._client = client
+
+        # GET response cache: key -> (expires_at, etag, payload), in LRU order.
+        # Disabled when cache_ttl is 0.
+        self._cache_ttl = cache_ttl
+        self._cache_max_size = cache_max_size
+        self._cache: OrderedDict[_RequestKey, tuple[float, Optional[str], bytes]] = (
+            OrderedDict()
         )
+        # GETs currently being fetched; identical concurrent GETs share one.
+        self._inflight: dict[_RequestKey, asyncio.Future[bytes]] = {}
+        # Bumped by every write, so GETs fetched before it are not cached.
+        self._generation = 0
 
     async def _request(
         self, method: str, endpoint: str, params: Optional[dict[str, Any]] = None
     ) -> dict[str, Any]:
-        """Helper method to make authenticated requests to Jira API."""
-        url = urljoin(self.api_base_url, endpoint)
-        try:
-            response = await self._client.request(method, url, params=params)
-            response.raise_for_status()  # Raises HTTPStatusError for 4xx/5xx responses
-            return response.json()
-        except httpx.HTTPStatusError as e:
-            # Log error or handle specific statuses
-            print(f"HTTP error occurred: {e.response.status_code} - {e.response.text}")
-            raise
-        except httpx.RequestError as e:
-            # Log error or handle network issues
-            print(f"Request error occurred: {e}")
-            raise
+        """Helper method to make authenticated requests to Jira API.
+
+        Identical GETs issued concurrently share a single HTTP request. When
+        `cache_ttl` is set, GET responses are also cached per endpoint and
+        params. Any other method may change Jira data: it clears the cache, and
+        GETs already in flight are neither joined nor cached afterwards.
+
+        Cached and shared responses are kept as raw bytes and decoded per call,
+        so every caller gets its own payload and may modify it freely.
+        """
+        if method != "GET":
+            try:
+                response = await self._send(method, endpoint, params)
+            finally:
+                self._cache.clear()
+                self._inflight.clear()
+                self._generation += 1
+            return _decode(response.content)
+
+        key = _request_key(endpoint, params)
+        cached = self._cache.get(key)
+        if cached is not None and time.monotonic() < cached[0]:
+            self._cache.move_to_end(key)
+            return _decode(cached[2])
+
+        inflight = self._inflight.get(key)
+        if inflight is None:
+
+            def forget(fetch: asyncio.Future[bytes]) -> None:
+                if self._inflight.get(key) is fetch:
+                    del self._inflight[key]
+                # Mark a failure as retrieved; if every caller was cancelled,
+                # nobody else will, and asyncio would log it as unhandled.
+                if not fetch.cancelled():
+                    fetch.exception()
+
+            inflight = asyncio.ensure_future(self._get(key, endpoint, params))
+            self._inflight[key] = inflight
+            inflight.add_done_callback(forget)
+        # Shielded so one cancelled caller does not cancel the shared fetch.
+        return _decode(await asyncio.shield(inflight))
+
+    async def _get(
+        self, key: _RequestKey, endpoint: str, params: Optional[dict[str, Any]]
+    ) -> bytes:
+        """Fetches a GET body, revalidating and caching it when caching is enabled.
+
+        Expired entries are revalidated with `If-None-Match` so an unchanged
+        result costs a 304 instead of a full body.
+        """
+        generation = self._generation
+        cached = self._cache.get(key)
+        headers = None
+        if cached is not None and cached[1]:
+            headers = {"If-None-Match": cached[1]}
+
+        response = await self._send("GET", endpoint, params, headers=headers)
+        if response.status_code == httpx.codes.NOT_MODIFIED and cached is not None:
+            etag, content = response.headers.get("ETag", cached[1]), cached[2]
+        else:
+            etag, content = response.headers.get("ETag"), response.content
+
+        if self._cache_ttl > 0 and generation == self._generation:
+            self._cache[key] = (time.monotonic() + self._cache_ttl, etag, content)
+            self._cache.move_to_end(key)
+            if len(self._cache) > self._cache_max_size:
+                self._cache.popitem(last=False)
+        return content
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[dict[str, Any]] = None,
+        headers: Optional[dict[str, str]] = None,
+    ) -> httpx.Response:
+        """Sends a request, retrying transient failures on idempotent methods."""
+        max_attempts = MAX_REQUEST_ATTEMPTS if method in IDEMPOTENT_METHODS else 1
+        attempt = 1
+        while True:
+            try:
+                response = await self._client.request(
+                    method, endpoint, params=params, headers=headers
+                )
+                if response.status_code == httpx.codes.NOT_MODIFIED:
+                    return response  # Conditional GET; caller holds the body
+                if response.status_code < 500 or attempt >= max_attempts:
+                    response.raise_for_status()  # Raises for 4xx/5xx responses
+                    return response
+            except httpx.HTTPStatusError as e:
+                # Log error or handle specific statuses
+                print(
+                    f"HTTP error occurred: {e.response.status_code} - {e.response.text}"
+                )
+                raise
+            except httpx.TransportError as e:
+                if attempt >= max_attempts:
+                    print(f"Request error occurred: {e}")
+                    raise
+            except httpx.RequestError as e:
+                # Log error or handle network issues
+                print(f"Request error occurred: {e}")
+                raise
+            await asyncio.sleep(
+                min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** (attempt - 1))
+            )
+            attempt += 1
 
     def _build_jql_query(
         self,
@@ -72,44 +331,13 @@ class JiraClient:
         status: Optional[str] = None,
     ) -> str:
         """Builds a JQL query string from filter parameters."""
-        jql_parts = []
-        if project_key:
-            jql_parts.append(f"project = {project_key}")
-
-        if issue_types:
-            types_list = [f'"{it}"' for it in issue_types]
-            types_str = ", ".join(types_list)  # Enclose in quotes for JQL
-            jql_parts.append(f"issueType in ({types_str})")
-
-        if labels:
-            # Assuming labels are single words without spaces, or handled by Jira's JQL parsing
-            labels_list = [f'"{label}"' for label in labels]
-            labels_str = ", ".join(labels_list)
-            jql_parts.append(f"labels in ({labels_str})")
-
-        if assignee:
-            # Assignee can be username or display name, Jira handles this.
-            # For unassigned, use assignee is EMPTY or assignee is NULL
-            jql_parts.append(f'assignee = "{assignee}"')  # Enclose in quotes
-
-        if status:
-            allowed_statuses = [
-                "To Do",
-                "In Progress",
-                "Done",
-                "Backlog",
-                "Selected for Development",
-            ]
-            if status not in allowed_statuses:
-                error_part1 = f"Invalid status: '{status}'. "
-                error_part2 = "Allowed statuses are: "
-                error_part3 = ", ".join(allowed_statuses)
-                full_error_message = error_part1 + error_part2 + error_part3
-                raise FilterValidationError(full_error_message)
-            # Status names can have spaces, so enclose in quotes
-            jql_parts.append(f'status = "{status}"')
-
-        return " AND ".join(jql_parts)
+        return _build_jql_query(
+            project_key,
+            tuple(issue_types) if issue_types else None,
+            tuple(labels) if labels else None,
+            assignee,
+            status,
+        )
 
     async def search_issues(
         self,
@@ -117,23 +345,159 @@ class JiraClient:
         fields: Optional[list[str]] = None,
         start_at: int = 0,
         max_results: int = 50,
+        next_page_token: Optional[str] = None,
     ) -> dict[str, Any]:
-        """Performs a JQL search."""
-        params = {
-            "jql": jql,
-            "startAt": start_at,
-            "maxResults": max_results,
-        }
-        if fields:
-            params["fields"] = ",".join(fields)
+        """Performs a JQL search.
+
+        With enhanced search, pages are addressed by `next_page_token` and the
+        response carries `nextPageToken` instead of `total`; a non-zero
+        `start_at` raises ValueError. Otherwise the classic `startAt`-based
+        endpoint is used.
+        """
+        params: dict[str, Any] = {"jql": jql, "maxResults": max_results}
+        if self.use_enhanced_search:
+            if start_at:
+                raise ValueError(
+                    "start_at is not supported by enhanced search; "
+                    "page with next_page_token instead."
+                )
+            path = ENHANCED_SEARCH_PATH
+            if next_page_token:
+                params["nextPageToken"] = next_page_token
+        else:
+            path = SEARCH_PATH
+            params["startAt"] = start_at
+        params["fields"] = ",".join(fields) if fields else _DEFAULT_SEARCH_FIELDS
+
+        return await self._request("GET", path, params=params)
+
+    async def iter_issues(
+        self,
+        jql: str,
+        fields: Optional[list[str]] = None,
+        page_size: int = SEARCH_PAGE_SIZE,
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """Yields every issue matching a JQL search, page by page."""
+        if self.use_enhanced_search:
+            pages = self._iter_token_pages(jql, fields, page_size)
         else:
-            # Default fields, can be adjusted
-            params["fields"] = (
-                "summary,status,assignee,labels,issuetype,priority,"
-                "reporter,created,updated,duedate,parent"
+            pages = self._iter_offset_pages(jql, fields, page_size)
+        async for issues in pages:
+            for issue in issues:
+                yield issue
+
+    async def _iter_token_pages(
+        self, jql: str, fields: Optional[list[str]], page_size: int
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Yields enhanced-search pages, following `nextPageToken`."""
+        next_page_token = None
+        while True:
+            page = await self.search_issues(
+                jql,
+                fields=fields,
+                max_results=page_size,
+                next_page_token=next_page_token,
+            )
+            yield page.get("issues", [])
+            next_page_token = page.get("nextPageToken")
+            if not next_page_token:
+                return
+
+    async def _iter_offset_pages(
+        self, jql: str, fields: Optional[list[str]], page_size: int
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Yields classic search pages by `startAt` offset.
+
+        The first page reveals `total`; the remaining pages are then fetched
+        `PAGE_FETCH_CONCURRENCY` at a time, so their round-trips overlap while
+        at most one window of pages is in memory.
+        """
+        first_page = await self.search_issues(
+            jql, fields=fields, start_at=0, max_results=page_size
+        )
+        issues = first_page.get("issues", [])
+        yield issues
+        if not issues:
+            return
+
+        # Step by what Jira actually returned, as it may cap maxResults.
+        step = len(issues)
+        total = first_page.get("total", 0)
+        start_at = step
+        while start_at < total:
+            window_end = min(total, start_at + step * PAGE_FETCH_CONCURRENCY)
+            pages = await asyncio.gather(
+                *(
+                    self.search_issues(
+                        jql, fields=fields, start_at=offset, max_results=page_size
+                    )
+                    for offset in range(start_at, window_end, step)
+                )
             )
+            for page in pages:
+                yield page.get("issues", [])
+            start_at = window_end
+
+    async def _search_all(
+        self,
+        jql: str,
+        fields: Optional[list[str]] = None,
+        max_results: Optional[int] = None,
+        paginate: bool = True,
+    ) -> list[dict[str, Any]]:
+        """Collects the pages of a JQL search into a list.
 
-        return await self._request("GET", "search", params=params)
+        This backs `get_epics`, `get_stories` and `get_tasks`. At most
+        `max_results` issues are returned when it is set. With
+        `paginate=False` only the first search page is fetched.
+        """
+        if max_results is not None and max_results <= 0:
+            return []
+        page_size = min(SEARCH_PAGE_SIZE, max_results or SEARCH_PAGE_SIZE)
+        if not paginate:
+            page = await self.search_issues(jql, fields=fields, max_results=page_size)
+            first_page: list[dict[str, Any]] = page.get("issues", [])
+            return first_page
+
+        found: list[dict[str, Any]] = []
+        issues = self.iter_issues(jql, fields=fields, page_size=page_size)
+        try:
+            async for issue in issues:
+                found.append(issue)
+                if max_results is not None and len(found) >= max_results:
+                    break
+        finally:
+            await issues.aclose()
+        return found
+
+    async def get_issues(
+        self,
+        issue_types: list[str],
+        project_key: Optional[str] = None,
+        labels: Optional[list[str]] = None,
+        assignee: Optional[str] = None,
+        status: Optional[str] = None,
+        fields: Optional[list[str]] = None,
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Retrieves several issue types in one search, grouped by type name.
+
+        A single `issueType in (...)` query replaces one search per type; the
+        results are partitioned client-side by `fields.issuetype.name`.
+        """
+        jql = self._build_jql_query(
+            project_key=project_key,
+            issue_types=issue_types,
+            labels=labels,
+            assignee=assignee,
+            status=status,
+        )
+        if fields and "issuetype" not in fields:
+            fields = [*fields, "issuetype"]  # Needed to partition the results
+        grouped: dict[str, list[dict[str, Any]]] = {it: [] for it in issue_types}
+        async for issue in self.iter_issues(jql, fields=fields):
+            type_name = issue["fields"]["issuetype"]["name"]
+            grouped.setdefault(type_name, []).append(issue)
+        return grouped
 
     async def get_epics(
         self,
@@ -142,8 +506,10 @@ class JiraClient:
         assignee: Optional[str] = None,
         status: Optional[str] = None,
         fields: Optional[list[str]] = None,
+        max_results: Optional[int] = None,
+        paginate: bool = True,
     ) -> list[dict[str, Any]]:
-        """Retrieves Epics, optionally filtered."""
+        """Retrieves Epics, optionally filtered and capped."""
         jql = self._build_jql_query(
             project_key=project_key,
             issue_types=["Epic"],
@@ -153,8 +519,64 @@ class JiraClient:
         )
         # Add specific Epic fields if necessary, e.g., 'customfield_XXXXX' for Epic Name
         # For now, using default fields from search_issues
-        response_data = await self.search_issues(jql, fields=fields)
-        return response_data.get("issues", [])
+        return await self._search_all(
+            jql, fields=fields, max_results=max_results, paginate=paginate
+        )
+
+    async def get_issues_batch(
+        self,
+        project_key: Optional[str] = None,
+        want: Sequence[str] = ("epic", "story", "task"),
+        labels: Optional[list[str]] = None,
+        assignee: Optional[str] = None,
+        status: Optional[str] = None,
+        fields: Optional[list[str]] = None,
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Retrieves several issue kinds with one search, keyed by kind.
+
+        `want` holds keys of ISSUE_KIND_TYPES; e.g. "task" covers both Task
+        and Sub-task issues.
+        """
+        unknown = [kind for kind in want if kind not in ISSUE_KIND_TYPES]
+        if unknown:
+            raise FilterValidationError(
+                f"Invalid issue kinds: {unknown}. "
+                f"Allowed kinds are: {', '.join(ISSUE_KIND_TYPES)}"
+            )
+        grouped = await self.get_issues(
+            [it for kind in want for it in ISSUE_KIND_TYPES[kind]],
+            project_key=project_key,
+            labels=labels,
+            assignee=assignee,
+            status=status,
+            fields=fields,
+        )
+        return {
+            kind: [issue for it in ISSUE_KIND_TYPES[kind] for issue in grouped[it]]
+            for kind in want
+        }
+
+    def iter_epics(
+        self,
+        project_key: Optional[str] = None,
+        labels: Optional[list[str]] = None,
+        assignee: Optional[str] = None,
+        status: Optional[str] = None,
+        fields: Optional[list[str]] = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Yields Epics page by page, optionally filtered.
+
+        The JQL is built eagerly so invalid filters raise here rather than on
+        the first iteration.
+        """
+        jql = self._build_jql_query(
+            project_key=project_key,
+            issue_types=["Epic"],
+            labels=labels,
+            assignee=assignee,
+            status=status,
+        )
+        return self.iter_issues(jql, fields=fields)
 
     async def get_stories(
         self,
@@ -163,8 +585,10 @@ class JiraClient:
         assignee: Optional[str] = None,
         status: Optional[str] = None,
         fields: Optional[list[str]] = None,
+        max_results: Optional[int] = None,
+        paginate: bool = True,
     ) -> list[dict[str, Any]]:
-        """Retrieves Stories, optionally filtered."""
+        """Retrieves Stories, optionally filtered and capped."""
         jql = self._build_jql_query(
             project_key=project_key,
             issue_types=["Story"],
@@ -172,8 +596,9 @@ class JiraClient:
             assignee=assignee,
             status=status,
         )
-        response_data = await self.search_issues(jql, fields=fields)
-        return response_data.get("issues", [])
+        return await self._search_all(
+            jql, fields=fields, max_results=max_results, paginate=paginate
+        )
 
     async def get_tasks(
         self,
@@ -182,8 +607,10 @@ class JiraClient:
         assignee: Optional[str] = None,
         status: Optional[str] = None,
         fields: Optional[list[str]] = None,
+        max_results: Optional[int] = None,
+        paginate: bool = True,
     ) -> list[dict[str, Any]]:
-        """Retrieves Tasks, optionally filtered."""
+        """Retrieves Tasks, optionally filtered and capped."""
         # Assuming 'Task' is the standard issue type name. It might be 'Sub-task' or custom.
         jql = self._build_jql_query(
             project_key=project_key,
@@ -195,12 +622,20 @@ class JiraClient:
             assignee=assignee,
             status=status,
         )
-        response_data = await self.search_issues(jql, fields=fields)
-        return response_data.get("issues", [])
+        return await self._search_all(
+            jql, fields=fields, max_results=max_results, paginate=paginate
+        )
+
+    async def close(self) -> None:
+        """Closes the underlying HTTP client if this instance owns it."""
+        if self._owns_client:
+            await self._client.aclose()
+
+    async def __aenter__(self) -> "JiraClient":
+        return self
 
-    async def close(self):
-        """Closes the underlying HTTP client."""
-        await self._client.aclose()
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
 
 
 # Example Usage (for testing purposes, remove or guard with if __name__ == "__main__")
@@ -26,13 +26,14 @@ from typing import Any, Literal, Optional
 from dotenv import load_dotenv
 from langchain.llms.base import BaseLLM
 from langchain.prompts import PromptTemplate
-from langchain_community.llms import VertexAI
-from langchain_community.llms.anthropic import Anthropic
-from langchain_openai import ChatOpenAI
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Load environment variables from .env file if it exists. Done once at import
+# rather than re-parsing the file for every LLMClient instance.
+load_dotenv()
+
 
 class ConfigurationError(Exception):
     """Raised when there is an issue with configuration or credentials."""
@@ -54,14 +55,12 @@ class LLMClient:
         """Initialize the LLM client wrapper.
 
         Loads credentials from environment variables and initializes
-        connections to supported LLM providers.
+        connections to supported LLM providers. A provider's SDK is only
+        imported when its credentials are present.
 
         Raises:
             ConfigurationError: If required credentials are missing.
         """
-        # Load environment variables from .env file if it exists
-        load_dotenv()
-
         # Initialize clients dictionary
         self.clients: dict[str, BaseLLM] = {}
 
@@ -78,6 +77,13 @@ class LLMClient:
                 f"{', '.join(self.SUPPORTED_PROVIDERS)}"
             )
 
+        # Build each provider's prompt -> LLM chain once; the template is fixed,
+        # so there is no need to re-parse it and rebuild the chain per call.
+        prompt_template = PromptTemplate.from_template("{prompt}")
+        self._chains = {
+            name: prompt_template | llm for name, llm in self.clients.items()
+        }
+
         # Set the default provider to the first available one
         self.default_provider = next(iter(self.clients.keys()))
         logger.info(f"Default provider set to: {self.default_provider}")
@@ -87,6 +93,8 @@ class LLMClient:
         api_key = os.getenv("OPENAI_API_KEY")
         if api_key:
             try:
+                from langchain_openai import ChatOpenAI
+
                 self.clients["openai"] = ChatOpenAI(
                     openai_api_key=api_key,
                     temperature=0.7,
@@ -103,6 +111,8 @@ class LLMClient:
         project_id = os.getenv("GOOGLE_CLOUD_PROJECT")
         if project_id:
             try:
+                from langchain_community.llms import VertexAI
+
                 self.clients["vertex"] = VertexAI(
                     project=project_id,
                     temperature=0.7,
@@ -121,6 +131,8 @@ class LLMClient:
         api_key = os.getenv("ANTHROPIC_API_KEY")
         if api_key:
             try:
+                from langchain_community.llms.anthropic import Anthropic
+
                 self.clients["claude"] = Anthropic(
                     anthropic_api_key=api_key,
                     temperature=0.7,
@@ -134,25 +146,13 @@ class LLMClient:
                 "Anthropic API key not found, skipping Claude initialization"
             )
 
-    def generate(
-        self,
-        prompt: str,
-        provider: Optional[Literal["openai", "vertex", "claude"]] = None,
-        **kwargs: Any,
+    def _select_provider(
+        self, provider: Optional[Literal["openai", "vertex", "claude"]]
     ) -> str:
-        """Generate a response from the specified LLM provider.
-
-        Args:
-            prompt: The text prompt to send to the LLM.
-            provider: The LLM provider to use. If None, uses the default provider.
-            **kwargs: Additional arguments to pass to the LLM.
-
-        Returns:
-            The generated text response.
+        """Resolve and validate the provider to use for a generation call.
 
         Raises:
-            ValueError: If the specified provider is not supported or not configured.
-            RuntimeError: If the LLM generation fails.
+            ValueError: If the provider is not supported or not configured.
         """
         # Determine which provider to use
         selected_provider = provider or self.default_provider
@@ -173,18 +173,98 @@ class LLMClient:
 
         # Log the provider being used
         logger.info(f"Generating response using provider: {selected_provider}")
+        return selected_provider
 
-        try:
-            # Get the LLM client for the selected provider
-            llm = self.clients[selected_provider]
+    @staticmethod
+    def _to_text(response: Any) -> str:
+        """Normalize an LLM chain output to plain text."""
+        return response.strip() if isinstance(response, str) else str(response)
+
+    def generate(
+        self,
+        prompt: str,
+        provider: Optional[Literal["openai", "vertex", "claude"]] = None,
+        **kwargs: Any,
+    ) -> str:
+        """Generate a response from the specified LLM provider.
+
+        Args:
+            prompt: The text prompt to send to the LLM.
+            provider: The LLM provider to use. If None, uses the default provider.
+            **kwargs: Additional arguments to pass to the LLM.
+
+        Returns:
+            The generated text response.
+
+        Raises:
+            ValueError: If the specified provider is not supported or not configured.
+            RuntimeError: If the LLM generation fails.
+        """
+        selected_provider = self._select_provider(provider)
 
-            # Create a simple prompt template and chain it with the LLM
-            prompt_template = PromptTemplate.from_template("{prompt}")
-            # Create a chain using the pipe operator
-            chain = prompt_template | llm
+        try:
+            # Get the prebuilt chain for the selected provider
+            chain = self._chains[selected_provider]
             # Invoke the chain with the prompt and any additional arguments
             response = chain.invoke({"prompt": prompt, **kwargs})
-            return response.strip() if isinstance(response, str) else str(response)
+            return self._to_text(response)
+        except Exception as e:
+            logger.error(f"Error generating response with {selected_provider}: {e}")
+            raise RuntimeError(f"Failed to generate response: {str(e)}")
+
+    async def agenerate(
+        self,
+        prompt: str,
+        provider: Optional[Literal["openai", "vertex", "claude"]] = None,
+        **kwargs: Any,
+    ) -> str:
+        """Asynchronously generate a response from the specified LLM provider.
+
+        Same contract as `generate`, but awaits the provider call so it does
+        not block the event loop and can be gathered with other calls.
+
+        Raises:
+            ValueError: If the specified provider is not supported or not configured.
+            RuntimeError: If the LLM generation fails.
+        """
+        selected_provider = self._select_provider(provider)
+
+        try:
+            chain = self._chains[selected_provider]
+            response = await chain.ainvoke({"prompt": prompt, **kwargs})
+            return self._to_text(response)
+        except Exception as e:
+            logger.error(f"Error generating response with {selected_provider}: {e}")
+            raise RuntimeError(f"Failed to generate response: {str(e)}")
+
+    async def abatch(
+        self,
+        prompts: list[str],
+        provider: Optional[Literal["openai", "vertex", "claude"]] = None,
+        **kwargs: Any,
+    ) -> list[str]:
+        """Generate responses for several prompts concurrently.
+
+        Args:
+            prompts: The text prompts to send to the LLM.
+            provider: The LLM provider to use. If None, uses the default provider.
+            **kwargs: Additional arguments to pass to the LLM for every prompt.
+
+        Returns:
+            The generated text responses, in the same order as `prompts`.
+
+        Raises:
+            ValueError: If the specified provider is not supported or not configured.
+            RuntimeError: If the LLM generation fails.
+        """
+        selected_provider = self._select_provider(provider)
+
+        try:
+            chain = self._chains[selected_provider]
+            responses = await chain.abatch(
+                [{"prompt": prompt, **kwargs} for prompt in prompts]
+            )
+            return [self._to_text(response) for response in responses]
         except Exception as e:
             logger.error(f"Error generating response with {selected_provider}: {e}")
             raise RuntimeError(f"Failed to generate response: {str(e)}")
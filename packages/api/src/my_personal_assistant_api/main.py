@@ -1,10 +1,17 @@
 """Main FastAPI application for My Personal Assistant API."""
 
 import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any, Optional
 
-from fastapi import FastAPI, HTTPException
+import httpx
+import orjson
+from fastapi import Depends, FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 
+from my_personal_assistant_api.core.jira_client import JiraClient
 from my_personal_assistant_api.core.llm_client import ConfigurationError, LLMClient
 from my_personal_assistant_shared.types.llm import LLMProvider, LLMRequest, LLMResponse
 
@@ -12,11 +19,33 @@ from my_personal_assistant_shared.types.llm import LLMProvider, LLMRequest, LLMR
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Create app-lifetime resources on startup and release them on shutdown.
+
+    A single JiraClient (and its pooled HTTP client) is shared by every request
+    so keep-alive connections to Jira are reused instead of re-handshaking.
+    """
+    try:
+        # Short TTL absorbs repeated identical searches from the UI.
+        app.state.jira_client = JiraClient(cache_ttl=30.0)
+    except ValueError as e:
+        logger.error(f"Failed to initialize Jira client: {e}")
+        app.state.jira_client = None
+    try:
+        yield
+    finally:
+        if app.state.jira_client is not None:
+            await app.state.jira_client.close()
+
+
 # Create FastAPI application
 app = FastAPI(
     title="My Personal Assistant API",
     description="API for My Personal Assistant",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 # Add CORS middleware
@@ -36,6 +65,35 @@ except ConfigurationError as e:
     llm_client = None
 
 
+# Jira fields read by _shape_issue; only these are requested from Jira.
+JIRA_ISSUE_FIELDS = ["summary", "status", "assignee", "labels", "issuetype"]
+
+
+def _shape_issue(issue: dict[str, Any]) -> dict[str, Any]:
+    """Flatten a raw Jira issue into the compact shape returned by the API."""
+    fields = issue["fields"]
+    assignee = fields.get("assignee")
+    return {
+        "id": issue["id"],
+        "key": issue["key"],
+        "summary": fields["summary"],
+        "issue_type": fields["issuetype"]["name"],
+        "status": fields["status"]["name"],
+        "assignee": assignee["displayName"] if assignee else None,
+        "labels": fields.get("labels", []),
+    }
+
+
+def get_jira_client(request: Request) -> JiraClient:
+    """Dependency returning the shared, app-lifetime Jira client."""
+    jira_client: Optional[JiraClient] = request.app.state.jira_client
+    if jira_client is None:
+        raise HTTPException(
+            status_code=503, detail="Jira client not initialized properly"
+        )
+    return jira_client
+
+
 @app.get("/")
 async def root() -> dict[str, str]:
     """Root endpoint returning API information."""
@@ -69,7 +127,7 @@ async def generate_text(request: LLMRequest) -> LLMResponse:
         provider_str = request.provider.value if request.provider else None
 
         # Generate response using the LLM client
-        response_text = llm_client.generate(
+        response_text = await llm_client.agenerate(
             request.prompt, provider=provider_str, **request.parameters
         )
 
@@ -88,7 +146,76 @@ async def generate_text(request: LLMRequest) -> LLMResponse:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/jira/issues")
+async def get_jira_issues(
+    project_key: Optional[str] = None,
+    labels: Optional[list[str]] = Query(None),
+    assignee: Optional[str] = None,
+    status: Optional[str] = None,
+    jira_client: JiraClient = Depends(get_jira_client),
+) -> dict[str, list[dict[str, Any]]]:
+    """Fetch epics, stories and tasks with a single Jira search."""
+    try:
+        batch = await jira_client.get_issues_batch(
+            project_key=project_key,
+            labels=labels,
+            assignee=assignee,
+            status=status,
+            fields=JIRA_ISSUE_FIELDS,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except httpx.HTTPError as e:
+        raise HTTPException(status_code=502, detail=f"Jira request failed: {e}")
+    return {
+        "epics": [_shape_issue(i) for i in batch["epic"]],
+        "stories": [_shape_issue(i) for i in batch["story"]],
+        "tasks": [_shape_issue(i) for i in batch["task"]],
+    }
+
+
+@app.get("/jira/epics/stream")
+async def stream_jira_epics(
+    project_key: Optional[str] = None,
+    labels: Optional[list[str]] = Query(None),
+    assignee: Optional[str] = None,
+    status: Optional[str] = None,
+    jira_client: JiraClient = Depends(get_jira_client),
+) -> StreamingResponse:
+    """Stream epics as NDJSON, holding only one search page in memory.
+
+    The first page is fetched before the response starts, so invalid filters
+    and Jira failures get a 400 or 502 rather than an empty 200 stream.
+    """
+    try:
+        epics = jira_client.iter_epics(
+            project_key=project_key,
+            labels=labels,
+            assignee=assignee,
+            status=status,
+            fields=JIRA_ISSUE_FIELDS,
+        )
+        first_epic: Optional[dict[str, Any]] = await epics.__anext__()
+    except StopAsyncIteration:
+        first_epic = None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except httpx.HTTPError as e:
+        raise HTTPException(status_code=502, detail=f"Jira request failed: {e}")
+
+    async def ndjson() -> AsyncIterator[bytes]:
+        if first_epic is None:
+            return
+        yield orjson.dumps(_shape_issue(first_epic)) + b"\n"
+        async for issue in epics:
+            yield orjson.dumps(_shape_issue(issue)) + b"\n"
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
+
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # loop/http "auto" select uvloop and httptools (from uvicorn[standard])
+    # when available, falling back to asyncio/h11 where they are not (Windows).
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop="auto", http="auto")
@@ -0,0 +1,81 @@
+import httpx
+import pytest
+import pytest_asyncio
+
+from my_personal_assistant_api.core.jira_client import JiraClient
+
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
+
+# pytest-asyncio 1.4 picks the loop through a hook and deprecates overriding
+# event_loop_policy; older releases, the newest on Python 3.9, only have the
+# fixture.
+_HAS_LOOP_FACTORIES = tuple(
+    int(part) for part in pytest_asyncio.__version__.split(".")[:2]
+) >= (1, 4)
+
+
+if uvloop is not None and _HAS_LOOP_FACTORIES:
+
+    def pytest_asyncio_loop_factories(config, item):
+        """Runs async tests on uvloop, matching uvicorn's loop in production."""
+        return {"uvloop": uvloop.new_event_loop}
+
+elif uvloop is not None:
+
+    @pytest.fixture(scope="session")
+    def event_loop_policy():
+        """Runs async tests on uvloop, matching uvicorn's loop in production."""
+        return uvloop.EventLoopPolicy()
+
+
+# Fixtures
+@pytest.fixture
+def mock_env_vars(monkeypatch):
+    monkeypatch.setenv("JIRA_BASE_URL", "https://test.jira.com")
+    monkeypatch.setenv("JIRA_USERNAME", "testuser")
+    monkeypatch.setenv("JIRA_API_TOKEN", "testtoken")
+    monkeypatch.delenv("JIRA_ENHANCED_SEARCH", raising=False)
+
+
+@pytest_asyncio.fixture
+async def mock_jira(mock_env_vars):
+    """Factory for JiraClients whose requests are answered by a handler.
+
+    Each client wraps an httpx.MockTransport; all are closed on teardown.
+    """
+    http_clients = []
+
+    def make(handler, **kwargs):
+        http = httpx.AsyncClient(
+            base_url="https://test.jira.com/rest/api/2/",
+            transport=httpx.MockTransport(handler),
+        )
+        http_clients.append(http)
+        return JiraClient(client=http, **kwargs)
+
+    yield make
+    for http in http_clients:
+        await http.aclose()
+
+
+@pytest.fixture
+def jira_issue():
+    """Factory for raw Jira issues carrying the fields the API reads."""
+
+    def make(key, type_name, assignee=None):
+        return {
+            "id": key.split("-")[1],
+            "key": key,
+            "fields": {
+                "summary": f"Summary of {key}",
+                "issuetype": {"name": type_name},
+                "status": {"name": "To Do"},
+                "assignee": {"displayName": assignee} if assignee else None,
+                "labels": ["backend"],
+            },
+        }
+
+    return make
@@ -1,19 +1,24 @@
+import asyncio
+import gc
 from unittest.mock import AsyncMock, patch
 
 import httpx
 import pytest
 
-from my_personal_assistant_api.core.jira_client import FilterValidationError, JiraClient
-
+from my_personal_assistant_api.core.jira_client import (
+    FilterValidationError,
+    JiraClient,
+    _build_jql_query,
+)
+from my_personal_assistant_shared.types.jira import JiraIssueStatus
 
-# Fixtures
-@pytest.fixture
-def mock_env_vars(monkeypatch):
-    monkeypatch.setenv("JIRA_BASE_URL", "https://test.jira.com")
-    monkeypatch.setenv("JIRA_USERNAME", "testuser")
-    monkeypatch.setenv("JIRA_API_TOKEN", "testtoken")
+# A real error built once and reused, rather than mocking its request/response.
+_FAKE_REQ = httpx.Request("GET", "https://test.jira.com/rest/api/2/search")
+_FAKE_RESP = httpx.Response(500, text="Server Error", request=_FAKE_REQ)
+_FAKE_ERR = httpx.HTTPStatusError("Error", request=_FAKE_REQ, response=_FAKE_RESP)
 
 
+# Fixtures
 @pytest.fixture
 def client(mock_env_vars):
     return JiraClient()
@@ -28,6 +33,9 @@ def test_jira_client_instantiation_success(mock_env_vars):
     assert client.base_url == "https://test.jira.com"
     assert client.username == "testuser"
     assert client.api_base_url == "https://test.jira.com/rest/api/2/"
+    assert client._client.base_url == "https://test.jira.com/rest/api/2/"
+    # base64("testuser:testtoken")
+    assert client._client.headers["Authorization"] == "Basic dGVzdHVzZXI6dGVzdHRva2Vu"
 
 
 def test_jira_client_instantiation_direct_params():
@@ -59,32 +67,55 @@ def test_jira_client_instantiation_missing_api_token(mock_env_vars, monkeypatch)
         JiraClient()
 
 
+@pytest.mark.parametrize(
+    "setting, expected", [(None, True), ("true", True), ("false", False), ("0", False)]
+)
+def test_jira_client_enhanced_search_from_env(
+    mock_env_vars, monkeypatch, setting, expected
+):
+    if setting is not None:
+        monkeypatch.setenv("JIRA_ENHANCED_SEARCH", setting)
+    assert JiraClient().use_enhanced_search is expected
+
+
+def test_jira_client_enhanced_search_param_overrides_env(mock_env_vars, monkeypatch):
+    monkeypatch.setenv("JIRA_ENHANCED_SEARCH", "false")
+    assert JiraClient(use_enhanced_search=True).use_enhanced_search is True
+
+
+@pytest.mark.parametrize("base_url", ["", "https://test.jira.com/"])
+def test_jira_client_rejects_client_with_other_base_url(mock_env_vars, base_url):
+    with pytest.raises(ValueError, match="must use https://test.jira.com/rest/api/2/"):
+        JiraClient(client=httpx.AsyncClient(base_url=base_url))
+
+
 # Tests for _build_jql_query
 
 
-@pytest.mark.parametrize(
-    "filters, expected_jql",
-    [
-        ({}, ""),
-        ({"project_key": "PROJ"}, "project = PROJ"),
-        ({"issue_types": ["Bug"]}, 'issueType in ("Bug")'),
-        ({"labels": ["backend"]}, 'labels in ("backend")'),
-        ({"assignee": "mork"}, 'assignee = "mork"'),
-        ({"status": "In Progress"}, 'status = "In Progress"'),
-        (
-            {
-                "project_key": "PROJ",
-                "labels": ["frontend", "urgent"],
-                "status": "To Do",
-            },
-            'project = PROJ AND labels in ("frontend", "urgent") AND status = "To Do"',
-        ),
-        (
-            {"issue_types": ["Story", "Task"], "assignee": "peerapong"},
-            'issueType in ("Story", "Task") AND assignee = "peerapong"',
-        ),
-    ],
+# Filter kwargs and the JQL each should build, defined once for collection.
+_JQL_CASES: tuple[tuple[dict, str], ...] = (
+    ({}, ""),
+    ({"project_key": "PROJ"}, "project = PROJ"),
+    ({"issue_types": ["Bug"]}, 'issueType in ("Bug")'),
+    ({"labels": ["backend"]}, 'labels in ("backend")'),
+    ({"assignee": "mork"}, 'assignee = "mork"'),
+    ({"status": "In Progress"}, 'status = "In Progress"'),
+    (
+        {
+            "project_key": "PROJ",
+            "labels": ["frontend", "urgent"],
+            "status": "To Do",
+        },
+        'project = PROJ AND labels in ("frontend", "urgent") AND status = "To Do"',
+    ),
+    (
+        {"issue_types": ["Story", "Task"], "assignee": "peerapong"},
+        'issueType in ("Story", "Task") AND assignee = "peerapong"',
+    ),
 )
+
+
+@pytest.mark.parametrize("filters, expected_jql", _JQL_CASES)
 def test_build_jql_query(client, filters, expected_jql):
     jql = client._build_jql_query(**filters)
     assert jql == expected_jql
@@ -97,14 +128,259 @@ def test_build_jql_query_invalid_status(client):
         client._build_jql_query(status="Invalid Status")
 
 
-def test_build_jql_query_valid_status(client):
-    jql = client._build_jql_query(status="Done")
-    assert 'status = "Done"' in jql
+def test_build_jql_query_invalid_status_lists_allowed_statuses(client):
+    with pytest.raises(FilterValidationError) as exc_info:
+        client._build_jql_query(status="Invalid Status")
+    allowed = ", ".join(sorted(s.value for s in JiraIssueStatus))
+    assert str(exc_info.value).endswith(f"Allowed statuses are: {allowed}")
+
+
+@pytest.mark.parametrize("status", [s.value for s in JiraIssueStatus])
+def test_build_jql_query_valid_status(client, status):
+    jql = client._build_jql_query(status=status)
+    assert f'status = "{status}"' in jql
+
+
+def test_build_jql_query_is_cached(client):
+    _build_jql_query.cache_clear()
+    client._build_jql_query(project_key="PROJ", labels=["a", "b"])
+    client._build_jql_query(project_key="PROJ", labels=["a", "b"])
+    assert _build_jql_query.cache_info().hits == 1
+
+
+# Tests for _request (mocking the HTTP transport)
+@pytest.mark.asyncio
+async def test_request_decodes_json_body(mock_jira):
+    def handler(request):
+        assert request.url == "https://test.jira.com/rest/api/2/search?jql=x"
+        return httpx.Response(200, json={"issues": [{"key": "PROJ-1"}]})
+
+    client = mock_jira(handler)
+
+    data = await client._request("GET", "search", params={"jql": "x"})
+
+    assert data == {"issues": [{"key": "PROJ-1"}]}
+
+
+@pytest.mark.asyncio
+async def test_request_retries_server_errors(mock_jira, mocker):
+    mock_sleep = mocker.patch("asyncio.sleep", new_callable=AsyncMock)
+    statuses = iter([503, 502, 200])
+
+    def handler(request):
+        return httpx.Response(next(statuses), json={"ok": True})
+
+    client = mock_jira(handler)
+
+    assert await client._request("GET", "search") == {"ok": True}
+    assert mock_sleep.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_request_does_not_retry_client_errors(mock_jira, mocker):
+    mock_sleep = mocker.patch("asyncio.sleep", new_callable=AsyncMock)
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(401, text="Unauthorized")
+
+    client = mock_jira(handler)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await client._request("GET", "search")
+    assert len(calls) == 1
+    mock_sleep.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_request_raises_after_transport_retries(mock_jira, mocker):
+    mocker.patch("asyncio.sleep", new_callable=AsyncMock)
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        raise httpx.ConnectError("boom", request=request)
+
+    client = mock_jira(handler)
+
+    with pytest.raises(httpx.ConnectError):
+        await client._request("GET", "search")
+    assert len(calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_request_cache_serves_fresh_and_revalidates_stale(mock_jira, mocker):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304, headers={"ETag": '"v1"'})
+        return httpx.Response(200, json={"total": 1}, headers={"ETag": '"v1"'})
+
+    client = mock_jira(handler, cache_ttl=60.0)
+    mock_time = mocker.patch("time.monotonic", return_value=0.0)
+
+    assert await client._request("GET", "search", params={"jql": "x"}) == {"total": 1}
+    assert await client._request("GET", "search", params={"jql": "x"}) == {"total": 1}
+    assert len(requests) == 1  # Served from cache within the TTL
+
+    mock_time.return_value = 61.0
+    assert await client._request("GET", "search", params={"jql": "x"}) == {"total": 1}
+    assert len(requests) == 2
+    assert requests[1].headers["If-None-Match"] == '"v1"'
+
+
+@pytest.mark.asyncio
+async def test_request_cache_cleared_by_non_get(mock_jira):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json={"n": len(requests)})
+
+    client = mock_jira(handler, cache_ttl=60.0)
+
+    assert await client._request("GET", "issue/T-1") == {"n": 1}
+    await client._request("PUT", "issue/T-1")
+    assert await client._request("GET", "issue/T-1") == {"n": 3}
+
+
+@pytest.mark.asyncio
+async def test_request_write_invalidates_inflight_gets(mock_jira):
+    version, started, release = [1], asyncio.Event(), asyncio.Event()
+
+    async def handler(request):
+        if request.method == "PUT":
+            version[0] = 2
+            return httpx.Response(200, json={})
+        seen = version[0]
+        if not started.is_set():  # The first GET is slow
+            started.set()
+            await release.wait()
+        return httpx.Response(200, json={"v": seen})
+
+    client = mock_jira(handler, cache_ttl=60.0)
+
+    stale = asyncio.ensure_future(client._request("GET", "issue/T-1"))
+    await started.wait()
+    await client._request("PUT", "issue/T-1")
+    # Joining `stale` would block until it is released, so time out instead.
+    fresh = await asyncio.wait_for(client._request("GET", "issue/T-1"), timeout=1)
+    release.set()
+
+    assert await stale == {"v": 1}
+    assert fresh == {"v": 2}
+    # The body fetched before the write is not cached over the newer one.
+    assert await client._request("GET", "issue/T-1") == {"v": 2}
+
+
+@pytest.mark.asyncio
+async def test_request_cache_hits_return_independent_payloads(mock_jira):
+    def handler(request):
+        return httpx.Response(200, json={"issues": [{"key": "T-1"}]})
+
+    client = mock_jira(handler, cache_ttl=60.0)
+
+    first = await client._request("GET", "search")
+    first["issues"].append({"key": "T-2"})
+
+    assert await client._request("GET", "search") == {"issues": [{"key": "T-1"}]}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("cache_ttl", [0.0, 60.0])
+async def test_request_accepts_list_params(mock_jira, cache_ttl):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json={"ok": True})
+
+    client = mock_jira(handler, cache_ttl=cache_ttl)
+    params = {"fields": ["summary", "status"]}
+
+    assert await client._request("GET", "issue/T-1", params=params) == {"ok": True}
+    assert await client._request("GET", "issue/T-1", params=params) == {"ok": True}
+    assert requests[0].url.params.get_list("fields") == ["summary", "status"]
+    assert len(requests) == (1 if cache_ttl else 2)
+
+
+@pytest.mark.asyncio
+async def test_request_shares_identical_inflight_gets(mock_jira):
+    requests = []
+
+    async def handler(request):
+        requests.append(request)
+        await asyncio.sleep(0)
+        return httpx.Response(200, json={"issues": []})
+
+    client = mock_jira(handler)
+
+    results = await asyncio.gather(
+        client._request("GET", "search", params={"jql": "x"}),
+        client._request("GET", "search", params={"jql": "x"}),
+        client._request("GET", "search", params={"jql": "y"}),
+    )
+
+    assert results == [{"issues": []}] * 3
+    assert len(requests) == 2  # The two identical GETs shared one request
+    assert client._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_request_inflight_callers_get_independent_payloads(mock_jira):
+    async def handler(request):
+        await asyncio.sleep(0)
+        return httpx.Response(200, json={"issues": []})
+
+    client = mock_jira(handler)
+
+    first, second = await asyncio.gather(
+        client._request("GET", "search", params={"jql": "x"}),
+        client._request("GET", "search", params={"jql": "x"}),
+    )
+
+    first["issues"].append({"key": "T-1"})
+    assert second == {"issues": []}
+
+
+@pytest.mark.asyncio
+async def test_request_retrieves_error_of_abandoned_inflight_get(mock_jira):
+    started, release = asyncio.Event(), asyncio.Event()
+
+    async def handler(request):
+        started.set()
+        await release.wait()
+        return httpx.Response(404, text="Not Found")
+
+    client = mock_jira(handler)
+    loop_errors = []
+    asyncio.get_running_loop().set_exception_handler(
+        lambda loop, context: loop_errors.append(context)
+    )
+
+    caller = asyncio.ensure_future(client._request("GET", "issue/T-404"))
+    await started.wait()
+    (fetch,) = client._inflight.values()
+    caller.cancel()  # The only caller goes away before the fetch fails
+    release.set()
+    await asyncio.wait([fetch, caller])
+    del fetch, caller
+    gc.collect()  # An unretrieved error is reported when the fetch is collected
+
+    assert loop_errors == []  # No "Task exception was never retrieved"
 
 
 # Tests for search_issues (mocking HTTP calls)
+@pytest.mark.parametrize(
+    "use_enhanced_search, path, paging",
+    [(True, "search/jql", {}), (False, "search", {"startAt": 0})],
+)
 @pytest.mark.asyncio
-async def test_search_issues_success(client, mocker):
+async def test_search_issues_success(client, mocker, use_enhanced_search, path, paging):
+    client.use_enhanced_search = use_enhanced_search
     mock_response_data = {"issues": [{"key": "PROJ-123"}], "total": 1}
 
     # Mock the internal _request method
@@ -116,10 +392,10 @@ async def test_search_issues_success(client, mocker):
 
     mock_request.assert_called_once_with(
         "GET",
-        "search",
+        path,
         params={
             "jql": jql,
-            "startAt": 0,
+            **paging,
             "maxResults": 50,
             "fields": "summary,status,assignee,labels,issuetype,priority,reporter,created,updated,duedate,parent",
         },
@@ -128,34 +404,45 @@ async def test_search_issues_success(client, mocker):
     await client.close()  # Close client to avoid warnings
 
 
+@pytest.mark.parametrize(
+    "use_enhanced_search, path, paging",
+    [(True, "search/jql", {"nextPageToken": "tok"}), (False, "search", {"startAt": 0})],
+)
 @pytest.mark.asyncio
-async def test_search_issues_with_fields(client, mocker):
+async def test_search_issues_with_fields(
+    client, mocker, use_enhanced_search, path, paging
+):
+    client.use_enhanced_search = use_enhanced_search
     mock_response_data = {"issues": [], "total": 0}
     mock_request = AsyncMock(return_value=mock_response_data)
     mocker.patch.object(client, "_request", new=mock_request)
 
     jql = "project = PROJ"
     fields = ["summary", "status"]
-    await client.search_issues(jql, fields=fields)
+    await client.search_issues(jql, fields=fields, next_page_token="tok")
 
     mock_request.assert_called_once_with(
         "GET",
-        "search",
-        params={"jql": jql, "startAt": 0, "maxResults": 50, "fields": "summary,status"},
+        path,
+        params={"jql": jql, **paging, "maxResults": 50, "fields": "summary,status"},
     )
     await client.close()
 
 
+@pytest.mark.asyncio
+async def test_search_issues_rejects_start_at_with_enhanced_search(client, mocker):
+    mock_request = mocker.patch.object(client, "_request", new=AsyncMock())
+
+    with pytest.raises(ValueError, match="start_at is not supported"):
+        await client.search_issues("project = PROJ", start_at=100)
+    mock_request.assert_not_called()
+    await client.close()
+
+
 @pytest.mark.asyncio
 async def test_search_issues_http_error(client, mocker):
     # Mock _request to raise an HTTPStatusError
-    mock_request = AsyncMock(
-        side_effect=httpx.HTTPStatusError(
-            "Error",
-            request=AsyncMock(),
-            response=AsyncMock(status_code=500, text="Server Error"),
-        )
-    )
+    mock_request = AsyncMock(side_effect=_FAKE_ERR)
     mocker.patch.object(client, "_request", new=mock_request)
 
     with pytest.raises(httpx.HTTPStatusError):
@@ -176,10 +463,18 @@ async def test_get_epics_calls_search_issues_correctly(client, mocker):
     await client.get_epics(project_key="TEST", labels=["epic-label"], status="To Do")
 
     expected_jql = 'project = TEST AND issueType in ("Epic") AND labels in ("epic-label") AND status = "To Do"'
-    mock_search_issues.assert_called_once_with(expected_jql, fields=None)
+    mock_search_issues.assert_called_once_with(
+        expected_jql, fields=None, max_results=100, next_page_token=None
+    )
     await client.close()
 
 
+def test_iter_epics_validates_filters_eagerly(client):
+    # Invalid filters must fail before streaming starts, not on first iteration.
+    with pytest.raises(FilterValidationError):
+        client.iter_epics(status="Invalid Status")
+
+
 @pytest.mark.asyncio
 async def test_get_stories_calls_search_issues_correctly(client, mocker):
     mock_search_issues = AsyncMock(return_value={"issues": []})
@@ -188,7 +483,9 @@ async def test_get_stories_calls_search_issues_correctly(client, mocker):
     await client.get_stories(project_key="TEST", assignee="user1")
 
     expected_jql = 'project = TEST AND issueType in ("Story") AND assignee = "user1"'
-    mock_search_issues.assert_called_once_with(expected_jql, fields=None)
+    mock_search_issues.assert_called_once_with(
+        expected_jql, fields=None, max_results=100, next_page_token=None
+    )
     await client.close()
 
 
@@ -200,7 +497,174 @@ async def test_get_tasks_calls_search_issues_correctly(client, mocker):
     await client.get_tasks(project_key="TEST", status="In Progress")
 
     expected_jql = 'project = TEST AND issueType in ("Task", "Sub-task") AND status = "In Progress"'
-    mock_search_issues.assert_called_once_with(expected_jql, fields=None)
+    mock_search_issues.assert_called_once_with(
+        expected_jql, fields=None, max_results=100, next_page_token=None
+    )
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_get_epics_without_pagination_fetches_one_page(client, mocker):
+    mock_search_issues = AsyncMock(
+        return_value={"issues": [{"key": "T-1"}], "nextPageToken": "p2"}
+    )
+    mocker.patch.object(client, "search_issues", new=mock_search_issues)
+
+    epics = await client.get_epics(project_key="TEST", max_results=10, paginate=False)
+
+    assert [i["key"] for i in epics] == ["T-1"]
+    mock_search_issues.assert_called_once_with(
+        'project = TEST AND issueType in ("Epic")', fields=None, max_results=10
+    )
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_get_stories_stops_paging_at_max_results(client, mocker):
+    pages = [
+        {"issues": [{"key": "T-1"}, {"key": "T-2"}], "nextPageToken": "p2"},
+        {"issues": [{"key": "T-3"}, {"key": "T-4"}], "nextPageToken": "p3"},
+        {"issues": [{"key": "T-5"}], "isLast": True},
+    ]
+    mock_search_issues = AsyncMock(side_effect=pages)
+    mocker.patch.object(client, "search_issues", new=mock_search_issues)
+
+    stories = await client.get_stories(project_key="TEST", max_results=3)
+
+    assert [i["key"] for i in stories] == ["T-1", "T-2", "T-3"]
+    assert mock_search_issues.await_count == 2  # The third page is never fetched
+    assert mock_search_issues.call_args.kwargs["max_results"] == 3
+    await client.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("paginate", [True, False])
+async def test_get_tasks_with_zero_max_results_fetches_nothing(
+    client, mocker, paginate
+):
+    mock_search_issues = AsyncMock(return_value={"issues": [{"key": "T-1"}]})
+    mocker.patch.object(client, "search_issues", new=mock_search_issues)
+
+    assert await client.get_tasks(max_results=0, paginate=paginate) == []
+    mock_search_issues.assert_not_called()
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_get_issues_single_search_grouped_by_type(client, mocker, jira_issue):
+    mock_search_issues = AsyncMock(
+        return_value={
+            "issues": [jira_issue("T-1", "Epic"), jira_issue("T-2", "Task")],
+            "total": 2,
+        }
+    )
+    mocker.patch.object(client, "search_issues", new=mock_search_issues)
+
+    grouped = await client.get_issues(
+        ["Epic", "Story", "Task"], project_key="TEST", fields=["summary"]
+    )
+
+    mock_search_issues.assert_called_once_with(
+        'project = TEST AND issueType in ("Epic", "Story", "Task")',
+        fields=["summary", "issuetype"],
+        max_results=100,
+        next_page_token=None,
+    )
+    assert [i["key"] for i in grouped["Epic"]] == ["T-1"]
+    assert grouped["Story"] == []
+    assert [i["key"] for i in grouped["Task"]] == ["T-2"]
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_get_issues_batch_uses_single_request(client, mocker, jira_issue):
+    mock_request = AsyncMock(
+        return_value={
+            "issues": [
+                jira_issue("T-1", "Epic"),
+                jira_issue("T-2", "Task"),
+                jira_issue("T-3", "Sub-task"),
+            ],
+            "total": 3,
+        }
+    )
+    mocker.patch.object(client, "_request", new=mock_request)
+
+    batch = await client.get_issues_batch(project_key="TEST")
+
+    mock_request.assert_called_once()
+    assert mock_request.call_args.kwargs["params"]["jql"] == (
+        'project = TEST AND issueType in ("Epic", "Story", "Task", "Sub-task")'
+    )
+    assert [i["key"] for i in batch["epic"]] == ["T-1"]
+    assert batch["story"] == []
+    assert [i["key"] for i in batch["task"]] == ["T-2", "T-3"]
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_get_issues_batch_invalid_kind(client):
+    with pytest.raises(FilterValidationError, match="Invalid issue kinds"):
+        await client.get_issues_batch(want=("bug",))
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_iter_issues_follows_next_page_token(client, mocker):
+    pages = [
+        {"issues": [{"key": "T-1"}, {"key": "T-2"}], "nextPageToken": "p2"},
+        {"issues": [{"key": "T-3"}], "isLast": True},
+    ]
+    mock_search_issues = AsyncMock(side_effect=pages)
+    mocker.patch.object(client, "search_issues", new=mock_search_issues)
+
+    keys = [issue["key"] async for issue in client.iter_issues("x", page_size=2)]
+
+    assert keys == ["T-1", "T-2", "T-3"]
+    assert mock_search_issues.call_args_list == [
+        mocker.call("x", fields=None, max_results=2, next_page_token=None),
+        mocker.call("x", fields=None, max_results=2, next_page_token="p2"),
+    ]
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_iter_issues_walks_all_pages(client, mocker):
+    client.use_enhanced_search = False
+    pages = [
+        {"issues": [{"key": "T-1"}, {"key": "T-2"}], "total": 3},
+        {"issues": [{"key": "T-3"}], "total": 3},
+    ]
+    mock_search_issues = AsyncMock(side_effect=pages)
+    mocker.patch.object(client, "search_issues", new=mock_search_issues)
+
+    keys = [issue["key"] async for issue in client.iter_issues("x", page_size=2)]
+
+    assert keys == ["T-1", "T-2", "T-3"]
+    assert mock_search_issues.call_args_list == [
+        mocker.call("x", fields=None, start_at=0, max_results=2),
+        mocker.call("x", fields=None, start_at=2, max_results=2),
+    ]
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_iter_issues_fetches_remaining_pages_concurrently(client, mocker):
+    async def search_issues(jql, fields=None, start_at=0, max_results=100):
+        keys = range(start_at, min(start_at + 2, 7))
+        return {"issues": [{"key": f"T-{k}"} for k in keys], "total": 7}
+
+    client.use_enhanced_search = False
+    mock_search_issues = AsyncMock(side_effect=search_issues)
+    mocker.patch.object(client, "search_issues", new=mock_search_issues)
+    mock_gather = mocker.spy(asyncio, "gather")
+
+    keys = [issue["key"] async for issue in client.iter_issues("x", page_size=2)]
+
+    assert keys == [f"T-{k}" for k in range(7)]
+    # One initial page, then the three remaining pages in a single window.
+    assert mock_search_issues.await_count == 4
+    assert mock_gather.call_count == 1
     await client.close()
 
 
@@ -212,3 +676,23 @@ async def test_client_close(client):
     with patch.object(client._client, "aclose", new_callable=AsyncMock) as mock_aclose:
         await client.close()
         mock_aclose.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_client_async_context_manager_closes(mock_env_vars):
+    async with JiraClient() as client:
+        aclose = AsyncMock()
+        client._client.aclose = aclose
+    aclose.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_client_close_does_not_close_shared_client(mock_env_vars):
+    # A caller-supplied httpx client is shared and must outlive the JiraClient.
+    shared = httpx.AsyncClient(base_url="https://test.jira.com/rest/api/2/")
+    client = JiraClient(client=shared)
+    assert client._client is shared
+    with patch.object(shared, "aclose", new_callable=AsyncMock) as mock_aclose:
+        await client.close()
+        mock_aclose.assert_not_called()
+    await shared.aclose()
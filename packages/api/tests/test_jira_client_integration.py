@@ -1,17 +1,28 @@
 import os
 
 import pytest
+import pytest_asyncio
 
-from my_personal_assistant_api.core.jira_client import FilterValidationError, JiraClient
+from my_personal_assistant_api.core.jira_client import (
+    ENHANCED_SEARCH_PATH,
+    SEARCH_PATH,
+    FilterValidationError,
+    JiraClient,
+)
 
-# This marker is used to selectively run integration tests
-pytestmark = pytest.mark.integration
+# This marker is used to selectively run integration tests. The xdist group
+# keeps the module on one worker under `--dist loadgroup`, so the tests share
+# the module-scoped client while other modules run in parallel.
+pytestmark = [pytest.mark.integration, pytest.mark.xdist_group("jira_integration")]
 
 
-@pytest.fixture(scope="module")
-def real_jira_client():
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def real_jira_client():
     """Provides a JiraClient instance configured for a real Jira server.
 
+    The client is shared by every test in the module and closed on teardown,
+    so its keep-alive connection pool is reused across tests.
+
     Requires JIRA_INTEGRATION_BASE_URL, JIRA_INTEGRATION_USERNAME,
     and JIRA_INTEGRATION_API_TOKEN environment variables
     to be set to connect to your actual Jira instance.
@@ -27,10 +38,13 @@ def real_jira_client():
             "Skipping integration tests."
         )
 
-    return JiraClient(base_url=base_url, username=username, api_token=api_token)
+    async with JiraClient(
+        base_url=base_url, username=username, api_token=api_token
+    ) as client:
+        yield client
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_connect_and_fetch_project_epics(real_jira_client: JiraClient):
     """Attempts to fetch epics from a specific project in your Jira instance.
 
@@ -65,11 +79,9 @@ async def test_connect_and_fetch_project_epics(real_jira_client: JiraClient):
         pytest.fail(f"Filter validation error during integration test: {e}")
     except Exception as e:
         pytest.fail(f"An unexpected error occurred during Jira API call: {e}")
-    finally:
-        await real_jira_client.close()
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_search_stories_with_label(real_jira_client: JiraClient):
     """Attempts to search for stories with a specific label.
 
@@ -103,11 +115,9 @@ async def test_search_stories_with_label(real_jira_client: JiraClient):
 
     except Exception as e:
         pytest.fail(f"An unexpected error occurred: {e}")
-    finally:
-        await real_jira_client.close()
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_invalid_status_filter_integration(real_jira_client: JiraClient):
     """Tests that providing an invalid status raises FilterValidationError even with a real API call."""
     project_key_to_test = os.getenv("JIRA_INTEGRATION_PROJECT_KEY", "PAT")
@@ -137,5 +147,20 @@ async def test_invalid_status_filter_integration(real_jira_client: JiraClient):
         )
     except Exception as e:
         print(f"Note: Could not verify 'Done' status due to: {e}")
-    finally:
-        await real_jira_client.close()
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_search_response_is_compressed(real_jira_client: JiraClient):
+    """Checks that Jira compresses search responses for the default client.
+
+    The raw response is fetched from the same search endpoint `search_issues`
+    uses, since the decoded result no longer carries its headers.
+    """
+    project_key_to_test = os.getenv("JIRA_INTEGRATION_PROJECT_KEY", "PAT")
+    path = ENHANCED_SEARCH_PATH if real_jira_client.use_enhanced_search else SEARCH_PATH
+
+    response = await real_jira_client._client.get(
+        path, params={"jql": f'project = "{project_key_to_test}"'}
+    )
+    response.raise_for_status()
+    assert response.headers.get("content-encoding") in ("gzip", "br")
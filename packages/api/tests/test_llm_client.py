@@ -2,6 +2,8 @@
 
 import logging
 
+import pytest
+
 from my_personal_assistant_api.core.llm_client import LLMClient
 
 # Configure basic logging
@@ -42,5 +44,90 @@ def test_llm_client():
         raise
 
 
+class _FakeChain:
+    """Stands in for a provider's prompt | llm chain, recording its inputs."""
+
+    def __init__(self, outputs=None, error=None):
+        self.outputs = outputs or []
+        self.error = error
+        self.inputs = []
+
+    async def ainvoke(self, inputs):
+        self.inputs.append(inputs)
+        if self.error:
+            raise self.error
+        return self.outputs[0]
+
+    async def abatch(self, inputs):
+        self.inputs.extend(inputs)
+        if self.error:
+            raise self.error
+        return self.outputs
+
+
+class _Message:
+    """A non-string chain output, like a chat model's message."""
+
+    def __str__(self):
+        return "message text"
+
+
+@pytest.fixture
+def offline_client(monkeypatch):
+    """An LLMClient configured for OpenAI only, without network access."""
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.delenv("GOOGLE_CLOUD_PROJECT", raising=False)
+    monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+    return LLMClient()
+
+
+async def test_agenerate_strips_text_and_passes_kwargs(offline_client):
+    chain = _FakeChain(outputs=["  A joke.\n"])
+    offline_client._chains = {"openai": chain}
+
+    text = await offline_client.agenerate("Tell a joke", temperature=0.1)
+
+    assert text == "A joke."
+    assert chain.inputs == [{"prompt": "Tell a joke", "temperature": 0.1}]
+
+
+async def test_agenerate_converts_non_string_output(offline_client):
+    offline_client._chains = {"openai": _FakeChain(outputs=[_Message()])}
+
+    assert await offline_client.agenerate("Hi") == "message text"
+
+
+async def test_agenerate_wraps_provider_errors(offline_client):
+    offline_client._chains = {"openai": _FakeChain(error=TimeoutError("slow"))}
+
+    with pytest.raises(RuntimeError, match="Failed to generate response: slow"):
+        await offline_client.agenerate("Hi")
+
+
+async def test_agenerate_rejects_unconfigured_provider(offline_client):
+    with pytest.raises(ValueError, match="Provider claude is not configured"):
+        await offline_client.agenerate("Hi", provider="claude")
+
+
+async def test_abatch_returns_texts_in_prompt_order(offline_client):
+    chain = _FakeChain(outputs=[" first ", _Message()])
+    offline_client._chains = {"openai": chain}
+
+    texts = await offline_client.abatch(["one", "two"], temperature=0.2)
+
+    assert texts == ["first", "message text"]
+    assert chain.inputs == [
+        {"prompt": "one", "temperature": 0.2},
+        {"prompt": "two", "temperature": 0.2},
+    ]
+
+
+async def test_abatch_wraps_provider_errors(offline_client):
+    offline_client._chains = {"openai": _FakeChain(error=ValueError("bad input"))}
+
+    with pytest.raises(RuntimeError, match="Failed to generate response: bad input"):
+        await offline_client.abatch(["one"])
+
+
 if __name__ == "__main__":
     test_llm_client()
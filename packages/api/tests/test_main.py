@@ -0,0 +1,154 @@
+import httpx
+import orjson
+import pytest
+from fastapi.testclient import TestClient
+
+from my_personal_assistant_api.core import jira_client as jira_client_module
+from my_personal_assistant_api.core.jira_client import JiraClient
+from my_personal_assistant_api.main import JIRA_ISSUE_FIELDS, app, get_jira_client
+
+
+def _unauthorized(request):
+    return httpx.Response(401, text="Unauthorized")
+
+
+def _unreachable(request):
+    raise httpx.ConnectError("Connection refused", request=request)
+
+
+# Fixtures
+@pytest.fixture
+def api(mock_jira, monkeypatch):
+    """Factory for TestClients whose Jira requests are answered by a handler.
+
+    The app's Jira dependency is overridden with a `mock_jira` client;
+    retries do not back off, so failures are quick.
+    """
+    monkeypatch.setattr(jira_client_module, "RETRY_BASE_DELAY", 0.0)
+
+    def make(handler):
+        jira = mock_jira(handler)
+        app.dependency_overrides[get_jira_client] = lambda: jira
+        return TestClient(app)
+
+    yield make
+    app.dependency_overrides.clear()
+
+
+# Tests for the app lifespan and the Jira dependency
+def test_lifespan_creates_and_closes_jira_client(mock_env_vars):
+    with TestClient(app):
+        jira = app.state.jira_client
+        assert isinstance(jira, JiraClient)
+        assert not jira._client.is_closed
+    assert jira._client.is_closed
+
+
+def test_jira_routes_unavailable_without_jira_config(mock_env_vars, monkeypatch):
+    monkeypatch.delenv("JIRA_BASE_URL")
+
+    with TestClient(app) as test_client:
+        response = test_client.get("/jira/issues")
+
+    assert app.state.jira_client is None
+    assert response.status_code == 503
+    assert response.json() == {"detail": "Jira client not initialized properly"}
+
+
+# Tests for /jira/issues
+def test_get_jira_issues_groups_and_shapes_issues(api, jira_issue):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        issues = [
+            jira_issue("T-1", "Epic", assignee="Mork"),
+            jira_issue("T-2", "Story"),
+            jira_issue("T-3", "Sub-task"),
+        ]
+        return httpx.Response(200, json={"issues": issues, "isLast": True})
+
+    response = api(handler).get("/jira/issues", params={"project_key": "TEST"})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["epics"] == [
+        {
+            "id": "1",
+            "key": "T-1",
+            "summary": "Summary of T-1",
+            "issue_type": "Epic",
+            "status": "To Do",
+            "assignee": "Mork",
+            "labels": ["backend"],
+        }
+    ]
+    assert [i["key"] for i in body["stories"]] == ["T-2"]
+    assert [i["key"] for i in body["tasks"]] == ["T-3"]
+    assert len(requests) == 1  # One search covers every issue type
+    assert requests[0].url.params["fields"] == ",".join(JIRA_ISSUE_FIELDS)
+
+
+def test_get_jira_issues_invalid_filter_returns_400(api):
+    def handler(request):
+        raise AssertionError("Jira must not be called for invalid filters")
+
+    response = api(handler).get("/jira/issues", params={"status": "Not A Status"})
+
+    assert response.status_code == 400
+    assert "Invalid status: 'Not A Status'." in response.json()["detail"]
+
+
+@pytest.mark.parametrize("handler", [_unauthorized, _unreachable])
+def test_get_jira_issues_jira_failure_returns_502(api, handler):
+    response = api(handler).get("/jira/issues")
+
+    assert response.status_code == 502
+    assert response.json()["detail"].startswith("Jira request failed")
+
+
+# Tests for /jira/epics/stream
+def test_stream_jira_epics_yields_ndjson_across_pages(api, jira_issue):
+    pages = {
+        None: {"issues": [jira_issue("T-1", "Epic")], "nextPageToken": "p2"},
+        "p2": {"issues": [jira_issue("T-2", "Epic")], "isLast": True},
+    }
+
+    def handler(request):
+        return httpx.Response(200, json=pages[request.url.params.get("nextPageToken")])
+
+    response = api(handler).get("/jira/epics/stream", params={"project_key": "TEST"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = [orjson.loads(line) for line in response.content.splitlines()]
+    assert [epic["key"] for epic in lines] == ["T-1", "T-2"]
+    assert lines[0]["issue_type"] == "Epic"
+
+
+def test_stream_jira_epics_empty_result(api):
+    def handler(request):
+        return httpx.Response(200, json={"issues": [], "isLast": True})
+
+    response = api(handler).get("/jira/epics/stream")
+
+    assert response.status_code == 200
+    assert response.content == b""
+
+
+def test_stream_jira_epics_invalid_filter_returns_400(api):
+    def handler(request):
+        raise AssertionError("Jira must not be called for invalid filters")
+
+    response = api(handler).get("/jira/epics/stream", params={"status": "Not A Status"})
+
+    assert response.status_code == 400
+    assert "Invalid status: 'Not A Status'." in response.json()["detail"]
+
+
+@pytest.mark.parametrize("handler", [_unauthorized, _unreachable])
+def test_stream_jira_epics_jira_failure_returns_502(api, handler):
+    response = api(handler).get("/jira/epics/stream")
+
+    assert response.status_code == 502
+    assert response.json()["detail"].startswith("Jira request failed")
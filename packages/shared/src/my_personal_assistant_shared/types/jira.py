@@ -4,12 +4,14 @@ from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class JiraIssueStatus(str, Enum):
     """Common Jira issue statuses."""
 
+    BACKLOG = "Backlog"
+    SELECTED_FOR_DEVELOPMENT = "Selected for Development"
     TO_DO = "To Do"
     IN_PROGRESS = "In Progress"
     IN_REVIEW = "In Review"
@@ -40,6 +42,8 @@ class JiraIssueType(str, Enum):
 class JiraUser(BaseModel):
     """Jira user information."""
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     id: str = Field(..., description="User ID")
     display_name: str = Field(..., description="User display name")
     email: Optional[str] = Field(None, description="User email address")
@@ -49,6 +53,8 @@ class JiraUser(BaseModel):
 class JiraIssueReference(BaseModel):
     """Basic reference to a Jira issue."""
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     key: str = Field(..., description="Issue key (e.g., 'PROJ-123')")
     id: str = Field(..., description="Issue ID")
     summary: str = Field(..., description="Issue summary")
@@ -3,7 +3,7 @@
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class LLMProvider(str, Enum):
@@ -17,6 +17,8 @@ class LLMProvider(str, Enum):
 class LLMRequest(BaseModel):
     """Request model for LLM generation."""
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     prompt: str = Field(..., description="The prompt to send to the LLM")
     provider: Optional[LLMProvider] = Field(
         None, description="The LLM provider to use (defaults to configured default)"
@@ -29,6 +31,8 @@ class LLMRequest(BaseModel):
 class LLMResponse(BaseModel):
     """Response model for LLM generation."""
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     text: str = Field(..., description="The generated text response")
     provider: LLMProvider = Field(..., description="The LLM provider that was used")
     tokens: Optional[Dict[str, int]] = Field(